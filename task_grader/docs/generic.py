@@ -1,3 +1,4 @@
+import os
 from abc import ABC, abstractmethod
 import requests
 
@@ -23,7 +24,7 @@ class SubmissionDownloader(ABC):
     def download_as(
         self,
         doc_url: str,
-        dest_dir: str,
+        dest_dir: str | os.PathLike[str],
         filename: str | None = None,
         as_format: str = "txt",
     ) -> str:
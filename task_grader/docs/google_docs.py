@@ -35,7 +35,7 @@ class GoogleDocsDownloader(SubmissionDownloader):
     def download_as(
         self,
         doc_url: str,
-        dest_dir: str,
+        dest_dir: str | os.PathLike[str],
         filename: str | None = None,
         as_format: str = "txt",
     ) -> str:
@@ -10,11 +10,21 @@ from .rubric import (
     SCORE_SCALE_DESCRIPTIONS,
     SCORE_SCALE_NUMERIC_RANGES,
     Rubric,
-    Criterion,
     ScoreScale,
 )
 from .prompt_builder import PromptBuilder
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+# Maximum score for each scale, used to normalize criterion scores
+_SCALE_MAX_SCORES: dict[ScoreScale, int] = {
+    scale: hi for scale, (_, hi) in SCORE_SCALE_NUMERIC_RANGES.items()
+}
+
 
 @dataclass
 class CriterionEvaluation:
@@ -216,7 +226,7 @@ class LLMTaskEvaluator:
     def _parse_yaml(yaml_text: str) -> dict[str, Any]:
         """Parse the YAML grading response into a Python dict, with basic shape validation."""
         try:
-            data = yaml.safe_load(yaml_text)
+            data = yaml.load(yaml_text, Loader=_YamlLoader)
         except yaml.YAMLError as exc:
             raise ValueError(f"Failed to parse YAML from LLM output: {exc}") from exc
 
@@ -246,11 +256,6 @@ class LLMTaskEvaluator:
         rubric: Rubric,
     ) -> list[CriterionEvaluation]:
         """Validate and convert YAML criterion entries into CriterionEvaluation objects."""
-        # Use lowercase keys for case-insensitive lookup, but keep canonical ids in the values
-        rubric_by_lower_id: dict[str, Criterion] = {
-            c.id.lower(): c for c in rubric.criteria
-        }
-
         seen_ids: set[str] = set()
         evaluations: list[CriterionEvaluation] = []
 
@@ -262,7 +267,7 @@ class LLMTaskEvaluator:
 
             try:
                 raw_id = item["id"]
-                cid_lower = raw_id.lower()
+                cid_key = raw_id.casefold()
                 name = item["name"]
                 score_scale = item["score_scale"]
                 score = item["score"]
@@ -272,10 +277,11 @@ class LLMTaskEvaluator:
                     f"Missing key in criterion evaluation entry: {exc}"
                 ) from exc
 
-            if cid_lower not in rubric_by_lower_id:
+            # Case-insensitive lookup; the rubric entry keeps the canonical id
+            rubric_criterion = rubric.criteria_index.get(cid_key)
+            if rubric_criterion is None:
                 raise ValueError(f"Criterion id {raw_id!r} not found in rubric")
 
-            rubric_criterion = rubric_by_lower_id[cid_lower]
             canonical_id = rubric_criterion.id  # preserve the rubric's original casing
 
             # Ensure name and scale match the rubric
@@ -323,7 +329,7 @@ class LLMTaskEvaluator:
 
             evaluations.append(
                 CriterionEvaluation(
-                    id=canonical_id,  # <- store canonical id, not lowercased id
+                    id=canonical_id,  # <- store canonical id, not case-folded id
                     name=name,
                     score_scale=score_scale,  # type: ignore[arg-type]
                     score=score,
@@ -365,18 +371,14 @@ class LLMTaskEvaluator:
             normalized_score = score / max_score_for_scale
         - Weighted sum of normalized scores is then scaled to rubric.overall_max_score.
         """
-        rubric_by_id: dict[str, Criterion] = {c.id: c for c in rubric.criteria}
-
-        total_weight = sum(c.weight for c in rubric.criteria)
+        total_weight = rubric.total_weight
         if total_weight <= 0:
             raise ValueError("Sum of rubric criterion weights must be positive")
 
-        weighted_sum = 0.0
-        for ev in criterion_evals:
-            rub_crit = rubric_by_id[ev.id]
-            _, max_score = SCORE_SCALE_NUMERIC_RANGES[ev.score_scale]
-            normalized = ev.score / max_score
-            weighted_sum += normalized * rub_crit.weight
+        weighted_sum = sum(
+            ev.score / _SCALE_MAX_SCORES[ev.score_scale] * rubric.weight_by_id[ev.id]
+            for ev in criterion_evals
+        )
 
         normalized_total = weighted_sum / total_weight
         return normalized_total * rubric.overall_max_score
@@ -1,10 +1,24 @@
 import json
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Literal, Mapping, get_args
+from typing import Any, Literal, Mapping, get_args
+
+# orjson is an optional, faster parser used when loading JSON files.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# the same exception either way.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 ScoreScale = Literal["0-1", "0-5", "0-10", "percentage"]
 
+# Accepted values for Criterion.scale, resolved from the Literal once at import
+_SCORE_SCALES: tuple[str, ...] = get_args(ScoreScale)
+_VALID_SCALES: frozenset[str] = frozenset(_SCORE_SCALES)
+
 # Numeric ranges for each score scale.
 # Used only for validation + computing an overall numeric score.
 SCORE_SCALE_NUMERIC_RANGES: dict[ScoreScale, tuple[int, int]] = {
@@ -43,7 +57,33 @@ SCORE_SCALE_DESCRIPTIONS: dict[ScoreScale, str] = _build_score_scale_description
 )
 
 
-@dataclass
+def _write_json(filepath: Path, data: dict[str, Any]) -> None:
+    """
+    Write data to filepath as 4-space indented JSON.
+
+    Always uses the stdlib encoder (orjson only supports 2-space indents),
+    so saved files look the same whether or not orjson is installed.
+    NaN and infinity are rejected with ValueError, since orjson cannot
+    load them back.
+    """
+    # Serialize up front: json.dump() issues one write() per encoder chunk,
+    # and a failed encode leaves no partial file behind
+    text = json.dumps(data, indent=4, allow_nan=False)
+    with open(filepath, "w") as f:
+        f.write(text)
+
+
+def _read_json(filepath: Path) -> dict[str, Any]:
+    """Read a JSON object from filepath."""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+
+    with open(filepath, "r") as f:
+        return json.load(f)
+
+
+@dataclass(slots=True, frozen=True)
 class Criterion:
     id: str
     name: str
@@ -52,9 +92,9 @@ class Criterion:
     scale: ScoreScale
 
     def __post_init__(self):
-        if self.scale not in SCORE_SCALE_DESCRIPTIONS:
+        if self.scale not in _VALID_SCALES:
             raise ValueError(
-                f"Invalid scale: {self.scale}. Must be one of {get_args(ScoreScale)}"
+                f"Invalid scale: {self.scale}. Must be one of {_SCORE_SCALES}"
             )
 
         if self.weight <= 0:
@@ -70,8 +110,7 @@ class Criterion:
 
         filepath: Path = dest_dir / f"{filename}.json"
 
-        with open(filepath, "w") as f:
-            json.dump(asdict(self), f, indent=4)
+        _write_json(filepath, asdict(self))
 
     @classmethod
     def load_from_json(cls, source_dir: str | Path, filename: str) -> "Criterion":
@@ -81,22 +120,26 @@ class Criterion:
 
         filepath: Path = source_dir / f"{filename}.json"
 
-        with open(filepath, "r") as f:
-            criterion_data = json.load(f)
+        criterion_data = _read_json(filepath)
 
         return cls(**criterion_data)
 
 
-@dataclass
+# Not slotted: cached_property needs an instance __dict__
+@dataclass(frozen=True)
 class Rubric:
     task_id: str
     title: str
     description: str
     overall_max_score: float
     min_passing_score: float
-    criteria: list[Criterion]
+    # Any sequence is accepted; __post_init__ stores it as a tuple so the
+    # cached properties below cannot go stale
+    criteria: Sequence[Criterion]
 
     def __post_init__(self):
+        object.__setattr__(self, "criteria", tuple(self.criteria))
+
         if not self.criteria:
             raise ValueError("criteria must be non-empty")
 
@@ -110,6 +153,21 @@ class Rubric:
                 f"Invalid min_passing_score: {self.min_passing_score}. Must be less than or equal to overall_max_score"
             )
 
+    @cached_property
+    def criteria_index(self) -> dict[str, Criterion]:
+        """Criteria keyed by case-folded id, for case-insensitive lookup."""
+        return {c.id.casefold(): c for c in self.criteria}
+
+    @cached_property
+    def total_weight(self) -> float:
+        """Sum of all criterion weights."""
+        return sum(c.weight for c in self.criteria)
+
+    @cached_property
+    def weight_by_id(self) -> dict[str, float]:
+        """Criterion weights keyed by exact (canonical) id."""
+        return {c.id: c.weight for c in self.criteria}
+
     def save_to_json(self, dest_dir: str | Path, filename: str) -> None:
         """Save a Rubric object to a JSON file"""
         if not isinstance(dest_dir, Path):
@@ -120,8 +178,7 @@ class Rubric:
 
         filepath: Path = dest_dir / f"{filename}.json"
 
-        with open(filepath, "w") as f:
-            json.dump(asdict(self), f, indent=4)
+        _write_json(filepath, asdict(self))
 
     @classmethod
     def load_from_json(cls, source_dir: str | Path, filename: str) -> "Rubric":
@@ -131,8 +188,7 @@ class Rubric:
 
         filepath: Path = source_dir / f"{filename}.json"
 
-        with open(filepath, "r") as f:
-            rubric_data = json.load(f)
+        rubric_data = _read_json(filepath)
 
         rubric_data["criteria"] = [
             Criterion(**criterion) for criterion in rubric_data["criteria"]
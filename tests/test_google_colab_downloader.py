@@ -1,9 +1,14 @@
 # tests/test_google_colab_downloader.py
 
+import io
 import os
+import shutil
 from pathlib import Path
+from typing import cast
 
 import pytest
+import requests
+from requests.adapters import HTTPAdapter
 
 from task_grader.docs.google_colab import (
     extract_drive_file_id,
@@ -37,19 +42,42 @@ class FakeResponse:
             yield chunk
 
 
+class FakeRawStream(io.BytesIO):
+    """In-memory stand-in for urllib3's response stream."""
+
+    decode_content: bool = False
+
+
+class FakeRawResponse(FakeResponse):
+    """FakeResponse that also exposes the body as a file-like `raw` stream."""
+
+    def __init__(self, body: bytes, **kwargs):
+        super().__init__(chunks=[], **kwargs)
+        self.raw = FakeRawStream(body)
+
+
 class FakeSession:
     def __init__(self, responses: list[FakeResponse]):
-        self._responses = responses
+        self._responses = iter(responses)
         self.calls: list[tuple[str, dict | None, bool]] = []
-        self._idx = 0
 
     def get(self, url: str, params=None, stream: bool = False, **_kwargs):
         self.calls.append((url, params, stream))
-        resp = self._responses[self._idx]
-        self._idx += 1
+        resp = next(self._responses)
         return resp
 
 
+class EchoSession:
+    """Thread-safe fake session whose response body is the requested file ID."""
+
+    def __init__(self):
+        self.calls: list[dict | None] = []
+
+    def get(self, url: str, params=None, stream: bool = False, **_kwargs):
+        self.calls.append(params)
+        return FakeResponse(chunks=[params["id"].encode()])
+
+
 # -------------------------------------------------------------------
 # extract_drive_file_id tests
 # -------------------------------------------------------------------
@@ -61,12 +89,51 @@ def test_extract_drive_file_id_colab_drive_path():
     assert file_id == "1AbCdEfGhIjK_lMnOp"
 
 
+@pytest.mark.parametrize("suffix", ["", "/", "?usp=sharing", "#scrollTo=abc", "&x=1"])
+def test_extract_drive_file_id_colab_drive_path_ends_at_delimiter(suffix: str):
+    url = f"https://colab.research.google.com/drive/1AbCdEfGhIjK_lMnOp{suffix}"
+    assert extract_drive_file_id(url) == "1AbCdEfGhIjK_lMnOp"
+
+
+def test_extract_drive_file_id_rejects_path_id_with_invalid_chars():
+    url = "https://colab.research.google.com/drive/1AbCdEf.GhIjK_lMnOp"
+    assert extract_drive_file_id(url) is None
+
+
 def test_extract_drive_file_id_open_id_param():
     url = "https://drive.google.com/open?id=1AbCdEfGhIjK_lMnOp"
     file_id = extract_drive_file_id(url)
     assert file_id == "1AbCdEfGhIjK_lMnOp"
 
 
+def test_extract_drive_file_id_id_param_after_other_params():
+    url = "https://drive.google.com/uc?export=download&id=1AbCdEfGhIjK_lMnOp"
+    file_id = extract_drive_file_id(url)
+    assert file_id == "1AbCdEfGhIjK_lMnOp"
+
+
+def test_extract_drive_file_id_decodes_percent_encoded_id_param():
+    url = "https://drive.google.com/open?id=1AbCdEf%2DGhIjK_lMnOp"
+    assert extract_drive_file_id(url) == "1AbCdEf-GhIjK_lMnOp"
+    assert extract_drive_file_id("https://drive.google.com/open?id=%41BC") == "ABC"
+
+
+def test_extract_drive_file_id_skips_empty_id_param():
+    url = "https://drive.google.com/open?id=&id=1AbCdEfGhIjK_lMnOp"
+    assert extract_drive_file_id(url) == "1AbCdEfGhIjK_lMnOp"
+
+
+@pytest.mark.parametrize("value", ["abc.def", "a+b", "abc%2Fdef"])
+def test_extract_drive_file_id_rejects_id_param_with_invalid_chars(value: str):
+    # A truncated ID would name a different Drive file, so none is returned
+    assert extract_drive_file_id(f"https://drive.google.com/open?id={value}") is None
+
+
+def test_extract_drive_file_id_ignores_id_in_fragment():
+    url = "https://example.com/page?usp=sharing#&id=1AbCdEfGhIjK_lMnOp"
+    assert extract_drive_file_id(url) is None
+
+
 def test_extract_drive_file_id_file_d_view():
     url = "https://drive.google.com/file/d/1AbCdEfGhIjK_lMnOp/view?usp=sharing"
     file_id = extract_drive_file_id(url)
@@ -78,6 +145,27 @@ def test_extract_drive_file_id_returns_none_for_invalid_url():
     assert extract_drive_file_id(url) is None
 
 
+# -------------------------------------------------------------------
+# GoogleColabDownloader session tests
+# -------------------------------------------------------------------
+
+
+def test_default_session_uses_pooled_retrying_adapter():
+    downloader = GoogleColabDownloader(session=None)
+
+    adapter = downloader._session.get_adapter("https://drive.google.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_given_session_is_used_as_is():
+    session = requests.Session()
+    downloader = GoogleColabDownloader(session=session)
+
+    assert downloader._session is session
+
+
 # -------------------------------------------------------------------
 # GoogleColabDownloader.download_as tests
 # -------------------------------------------------------------------
@@ -117,6 +205,46 @@ def test_download_as_success_without_confirm_token(tmp_path: Path):
     assert stream is True
 
 
+def test_download_as_copies_from_raw_stream(tmp_path: Path):
+    fake_resp = FakeRawResponse(body=b'{"cells": []}')
+    fake_session = FakeSession(responses=[fake_resp])
+
+    downloader = GoogleColabDownloader(session=cast(requests.Session, fake_session))
+
+    filepath = downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID789",
+        dest_dir=str(tmp_path),
+        filename="notebook",
+    )
+
+    with open(filepath, "rb") as f:
+        data = f.read()
+    assert data == b'{"cells": []}'
+
+    # The raw stream is asked to decode any Content-Encoding
+    assert fake_resp.raw.decode_content is True
+
+
+def test_download_as_handles_short_writes(tmp_path: Path, monkeypatch):
+    real_write = os.write
+
+    def write_one_byte(fd, data):
+        return real_write(fd, bytes(data[:1]))
+
+    monkeypatch.setattr(os, "write", write_one_byte)
+
+    fake_session = FakeSession(responses=[FakeResponse(chunks=[b"abc", b"", b"de"])])
+    downloader = GoogleColabDownloader(session=cast(requests.Session, fake_session))
+
+    filepath = downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID321",
+        dest_dir=str(tmp_path),
+    )
+
+    with open(filepath, "rb") as f:
+        assert f.read() == b"abcde"
+
+
 def test_download_as_success_with_confirm_token(tmp_path: Path):
     # First response has confirm token cookie, second has final content
     first_resp = FakeResponse(
@@ -159,6 +287,116 @@ def test_download_as_success_with_confirm_token(tmp_path: Path):
     assert params2 == {"id": "FILEID456", "confirm": "TOKEN123"}
 
 
+def test_download_many_returns_paths_in_input_order(tmp_path: Path):
+    fake_session = EchoSession()
+    downloader = GoogleColabDownloader(session=cast(requests.Session, fake_session))
+
+    submissions = [
+        ("https://colab.research.google.com/drive/FILEID1", "alice"),
+        ("https://drive.google.com/file/d/FILEID2/view", None),
+        ("https://drive.google.com/open?id=FILEID3", "carol"),
+    ]
+
+    filepaths = downloader.download_many(
+        submissions, dest_dir=str(tmp_path), max_workers=3
+    )
+
+    assert filepaths == [
+        os.path.join(str(tmp_path), "alice.ipynb"),
+        os.path.join(str(tmp_path), "FILEID2.ipynb"),
+        os.path.join(str(tmp_path), "carol.ipynb"),
+    ]
+    for filepath, file_id in zip(filepaths, ["FILEID1", "FILEID2", "FILEID3"]):
+        with open(filepath, "rb") as f:
+            assert f.read() == file_id.encode()
+
+    assert len(fake_session.calls) == 3
+
+
+def test_download_many_propagates_download_errors(tmp_path: Path):
+    downloader = GoogleColabDownloader(session=cast(requests.Session, EchoSession()))
+
+    with pytest.raises(ValueError) as excinfo:
+        downloader.download_many(
+            [
+                ("https://colab.research.google.com/drive/FILEID1", None),
+                ("https://example.com/not-drive", None),
+            ],
+            dest_dir=str(tmp_path),
+        )
+
+    assert "Could not extract document ID" in str(excinfo.value)
+
+
+def test_download_as_creates_each_dest_dir_once(tmp_path: Path, monkeypatch):
+    created: list[str] = []
+    real_makedirs = os.makedirs
+
+    def recording_makedirs(name, *args, **kwargs):
+        created.append(name)
+        real_makedirs(name, *args, **kwargs)
+
+    monkeypatch.setattr(os, "makedirs", recording_makedirs)
+
+    downloader = GoogleColabDownloader(session=cast(requests.Session, EchoSession()))
+
+    dest_dir = str(tmp_path / "cohort")
+    for file_id in ["FILEID1", "FILEID2"]:
+        downloader.download_as(
+            doc_url=f"https://colab.research.google.com/drive/{file_id}",
+            dest_dir=dest_dir,
+        )
+
+    assert created == [dest_dir]
+    assert sorted(os.listdir(dest_dir)) == ["FILEID1.ipynb", "FILEID2.ipynb"]
+
+
+def test_download_as_recreates_dest_dir_removed_between_downloads(tmp_path: Path):
+    downloader = GoogleColabDownloader(session=cast(requests.Session, EchoSession()))
+
+    dest_dir = str(tmp_path / "cohort")
+    downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID1",
+        dest_dir=dest_dir,
+    )
+
+    shutil.rmtree(dest_dir)
+
+    filepath = downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID2",
+        dest_dir=dest_dir,
+    )
+
+    with open(filepath, "rb") as f:
+        assert f.read() == b"FILEID2"
+
+
+def test_download_as_accepts_path_dest_dir(tmp_path: Path):
+    downloader = GoogleColabDownloader(session=cast(requests.Session, EchoSession()))
+
+    filepath = downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID1",
+        dest_dir=tmp_path,
+    )
+
+    assert filepath == os.path.join(str(tmp_path), "FILEID1.ipynb")
+    with open(filepath, "rb") as f:
+        assert f.read() == b"FILEID1"
+
+
+def test_download_as_accepts_dest_dir_with_trailing_separator(tmp_path: Path):
+    downloader = GoogleColabDownloader(session=cast(requests.Session, EchoSession()))
+
+    dest_dir = str(tmp_path) + os.sep
+    filepath = downloader.download_as(
+        doc_url="https://colab.research.google.com/drive/FILEID1",
+        dest_dir=dest_dir,
+    )
+
+    assert filepath == os.path.join(dest_dir, "FILEID1.ipynb")
+    assert os.path.isfile(filepath)
+
+
 def test_download_as_raises_for_invalid_url(tmp_path: Path):
     fake_session = FakeSession(responses=[])
     downloader = GoogleColabDownloader(session=None)
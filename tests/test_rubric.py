@@ -1,8 +1,12 @@
 import json
+import re
 import pytest
+from dataclasses import FrozenInstanceError, asdict
 from pathlib import Path
-from typing import get_args
+from types import MappingProxyType
+from typing import Any, Mapping, get_args
 
+from task_grader.grading import rubric as rubric_module
 from task_grader.grading.rubric import (
     ScoreScale,
     SCORE_SCALE_DESCRIPTIONS,
@@ -11,6 +15,53 @@ from task_grader.grading.rubric import (
 )
 
 
+@pytest.fixture(scope="session")
+def sample_criterion() -> Criterion:
+    """A valid criterion, shared across tests (Criterion is immutable)."""
+    return Criterion(
+        id="clarity",
+        name="Clarity",
+        description="How clear the submission is.",
+        weight=0.5,
+        scale="0-10",
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Temp directory shared by this module's JSON I/O tests (one filename per test)."""
+    return tmp_path_factory.mktemp("rubric_io")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch) -> str:
+    """Run a test with orjson (when installed) and with the stdlib json fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(rubric_module, "orjson", None)
+    return request.param
+
+
+@pytest.fixture
+def rubric_factory(sample_criterion: Criterion):
+    """Build a valid Rubric around sample_criterion, with per-test field overrides."""
+
+    def _make(**overrides) -> Rubric:
+        fields: dict[str, Any] = {
+            "task_id": "task-1",
+            "title": "Sample Rubric",
+            "description": "A test rubric.",
+            "overall_max_score": 100,
+            "min_passing_score": 60,
+            "criteria": [sample_criterion],
+        }
+        fields.update(overrides)
+        return Rubric(**fields)
+
+    return _make
+
+
 def test_score_scale_descriptions_cover_all_literals():
     """SCORE_SCALE_DESCRIPTIONS should have exactly one entry per ScoreScale literal."""
     literals = set(get_args(ScoreScale))
@@ -29,9 +80,8 @@ def test_score_scale_description_strings_are_non_empty():
         assert desc.strip(), f"Description for scale {scale!r} must not be empty."
 
 
-def test_score_scale_descriptions_correctness():
-    """Verify that SCORE_SCALE_DESCRIPTIONS contains the expected human-readable strings."""
-    expected_descriptions = {
+_EXPECTED_SCALE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType(
+    {
         # Special case for 0-1
         "0-1": "use an integer score of 0 or 1",
         # General case (from {lo} to {hi})
@@ -39,8 +89,12 @@ def test_score_scale_descriptions_correctness():
         "0-10": "use an integer score from 0 to 10",
         "percentage": "use an integer score from 0 to 100",
     }
+)
 
-    for scale, expected_desc in expected_descriptions.items():
+
+def test_score_scale_descriptions_correctness():
+    """Verify that SCORE_SCALE_DESCRIPTIONS contains the expected human-readable strings."""
+    for scale, expected_desc in _EXPECTED_SCALE_DESCRIPTIONS.items():
         assert (
             scale in SCORE_SCALE_DESCRIPTIONS
         ), f"Missing description for scale {scale!r}"
@@ -50,132 +104,88 @@ def test_score_scale_descriptions_correctness():
         )
 
 
-def test_rubric_post_init_accepts_valid_scores():
-    """Rubric should allow min_passing_score > 0 and <= overall_max_score."""
-    rubric = Rubric(
-        task_id="task-1",
-        title="Sample Rubric",
-        description="A test rubric.",
-        overall_max_score=100,
-        min_passing_score=60,
-        criteria=[
-            Criterion(
-                id="clarity",
-                name="Clarity",
-                description="How clear the submission is.",
-                weight=0.5,
-                scale="0-10",
+@pytest.mark.parametrize(
+    "min_passing_score, overall_max_score, expected_error",
+    [
+        (60, 100, None),
+        (100, 100, None),
+        (0, 100, "Must be positive"),
+        (60, 50, "less than or equal to overall_max_score"),
+    ],
+)
+def test_rubric_min_passing_score_validation(
+    rubric_factory,
+    min_passing_score: float,
+    overall_max_score: float,
+    expected_error: str | None,
+):
+    """Rubric should require 0 < min_passing_score <= overall_max_score."""
+    if expected_error:
+        with pytest.raises(ValueError) as excinfo:
+            rubric_factory(
+                min_passing_score=min_passing_score,
+                overall_max_score=overall_max_score,
             )
-        ],
-    )
-    assert rubric.overall_max_score == 100
-    assert rubric.min_passing_score == 60
-
-
-def test_rubric_post_init_rejects_non_positive_min_passing_score():
-    """Rubric should raise if min_passing_score is not positive."""
-    with pytest.raises(ValueError) as excinfo:
-        Rubric(
-            task_id="task-1",
-            title="Sample Rubric",
-            description="A test rubric.",
-            overall_max_score=100,
-            min_passing_score=0,
-            criteria=[
-                Criterion(
-                    id="clarity",
-                    name="Clarity of intent and scope",
-                    description="How clearly the evaluation intent and scope are stated.",
-                    weight=0.3,
-                    scale="0-10",
-                )
-            ],
+        excinfo.match(re.escape(expected_error))
+    else:
+        rubric = rubric_factory(
+            min_passing_score=min_passing_score,
+            overall_max_score=overall_max_score,
         )
-    assert "Must be positive" in str(excinfo.value)
+        assert rubric.overall_max_score == overall_max_score
+        assert rubric.min_passing_score == min_passing_score
 
 
-def test_rubric_post_init_rejects_min_passing_score_above_max():
-    """Rubric should raise if min_passing_score > overall_max_score."""
-    with pytest.raises(ValueError) as excinfo:
-        Rubric(
-            task_id="task-1",
-            title="Sample Rubric",
-            description="A test rubric.",
-            overall_max_score=50,
-            min_passing_score=60,
-            criteria=[
-                Criterion(
-                    id="clarity",
-                    name="Clarity of intent and scope",
-                    description="How clearly the evaluation intent and scope are stated.",
-                    weight=0.3,
-                    scale="0-10",
-                )
-            ],
-        )
-    assert "less than or equal to overall_max_score" in str(excinfo.value)
-
-
-def test_rubric_rejects_empty_criteria():
+def test_rubric_rejects_empty_criteria(rubric_factory):
     """Rubric should raise an error if criteria list is empty."""
     with pytest.raises(ValueError) as excinfo:
-        Rubric(
-            task_id="task-empty",
-            title="Empty Rubric",
-            description="This rubric has no criteria.",
-            overall_max_score=100,
-            min_passing_score=50,
-            criteria=[],  # empty list
-        )
-    msg = str(excinfo.value)
-    assert "criteria" in msg.lower()
-    assert "empty" in msg.lower()
+        rubric_factory(criteria=[])  # empty list
+    excinfo.match(r"(?i)criteria")
+    excinfo.match(r"(?i)empty")
 
 
-def test_rubric_save_to_json(tmp_path: Path):
+def test_rubric_save_to_json(shared_tmp: Path, rubric_factory):
     """Test saving a Rubric object to a JSON file and verify content."""
     # Setup
-    criterion = Criterion(
-        id="clarity",
-        name="Clarity",
-        description="How clear the submission is.",
-        weight=0.5,
-        scale="0-10",
-    )
-    rubric = Rubric(
+    rubric = rubric_factory(
         task_id="task-101",
         title="I/O Test Rubric",
         description="Test description.",
         overall_max_score=100.0,
         min_passing_score=50.0,
-        criteria=[criterion],
     )
 
     filename = "test_rubric_data"
-    filepath = tmp_path / f"{filename}.json"
+    filepath = shared_tmp / f"{filename}.json"
 
     # Action: Save the rubric
-    rubric.save_to_json(dest_dir=tmp_path, filename=filename)
+    rubric.save_to_json(dest_dir=shared_tmp, filename=filename)
 
     # Assertion: Verify the file exists
     assert filepath.is_file()
 
     # Assertion: Verify the content
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    # Check top-level attributes
-    assert data["task_id"] == "task-101"
-    assert data["overall_max_score"] == 100.0
-    assert data["min_passing_score"] == 50.0
-
-    # Check nested criteria data
-    assert len(data["criteria"]) == 1
-    assert data["criteria"][0]["id"] == "clarity"
-    assert data["criteria"][0]["scale"] == "0-10"
+    data = json.loads(filepath.read_text())
+
+    assert data == {
+        "task_id": "task-101",
+        "title": "I/O Test Rubric",
+        "description": "Test description.",
+        "overall_max_score": 100.0,
+        "min_passing_score": 50.0,
+        "criteria": [
+            {
+                "id": "clarity",
+                "name": "Clarity",
+                "description": "How clear the submission is.",
+                "weight": 0.5,
+                "scale": "0-10",
+            }
+        ],
+    }
 
 
-def test_rubric_load_from_json(tmp_path: Path):
+def test_rubric_load_from_json(shared_tmp: Path):
     """Test loading a Rubric object from a valid JSON file."""
     # Setup: Create a file to load
     data_to_save = {
@@ -196,13 +206,12 @@ def test_rubric_load_from_json(tmp_path: Path):
     }
 
     filename = "load_rubric_data"
-    filepath = tmp_path / f"{filename}.json"
+    filepath = shared_tmp / f"{filename}.json"
 
-    with open(filepath, "w") as f:
-        json.dump(data_to_save, f)
+    filepath.write_text(json.dumps(data_to_save, separators=(",", ":")))
 
     # Action: Load the rubric
-    loaded_rubric = Rubric.load_from_json(source_dir=tmp_path, filename=filename)
+    loaded_rubric = Rubric.load_from_json(source_dir=shared_tmp, filename=filename)
 
     # Assertion: Verify the loaded object's attributes
     assert isinstance(loaded_rubric, Rubric)
@@ -218,28 +227,54 @@ def test_rubric_load_from_json(tmp_path: Path):
     assert loaded_criterion.scale == "0-5"
 
 
-def test_rubric_load_from_json_file_not_found(tmp_path: Path):
+def test_rubric_load_from_json_file_not_found(shared_tmp: Path):
     """Test loading raises FileNotFoundError when file is missing."""
     with pytest.raises(FileNotFoundError):
         # Action: Try to load a file that doesn't exist
-        Rubric.load_from_json(source_dir=tmp_path, filename="non_existent_file")
+        Rubric.load_from_json(source_dir=shared_tmp, filename="non_existent_file")
 
 
-def test_rubric_load_from_json_invalid_json(tmp_path: Path):
+def test_rubric_load_from_json_invalid_json(shared_tmp: Path, json_backend: str):
     """Test loading raises JSONDecodeError when file content is invalid JSON."""
-    filename = "invalid_json_data"
-    filepath = tmp_path / f"{filename}.json"
+    filename = f"invalid_json_data_{json_backend}"
+    filepath = shared_tmp / f"{filename}.json"
 
     # Setup: Write non-JSON content to the file
-    with open(filepath, "w") as f:
-        f.write("{'bad_key': 'unquoted_string'}")  # Invalid JSON syntax
+    filepath.write_text("{'bad_key': 'unquoted_string'}")  # Invalid JSON syntax
 
     with pytest.raises(json.decoder.JSONDecodeError):
         # Action: Try to load the invalid file
-        Rubric.load_from_json(source_dir=tmp_path, filename=filename)
+        Rubric.load_from_json(source_dir=shared_tmp, filename=filename)
+
 
+def test_rubric_json_round_trip(shared_tmp: Path, json_backend: str, rubric_factory):
+    """A saved rubric loads back equal, and the file format does not depend on orjson."""
+    rubric = rubric_factory()
+    filename = f"round_trip_{json_backend}"
 
-def test_criterion_save_to_json(tmp_path: Path):
+    rubric.save_to_json(dest_dir=shared_tmp, filename=filename)
+    loaded_rubric = Rubric.load_from_json(source_dir=shared_tmp, filename=filename)
+
+    assert loaded_rubric == rubric
+    saved_text = (shared_tmp / f"{filename}.json").read_text()
+    assert saved_text == json.dumps(asdict(rubric), indent=4)
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("nan")])
+def test_rubric_save_to_json_rejects_non_finite_numbers(
+    shared_tmp: Path, json_backend: str, rubric_factory, value: float
+):
+    """Non-finite numbers cannot be loaded back by orjson, so they are not saved."""
+    rubric = rubric_factory(overall_max_score=value)
+    filename = f"non_finite_{value}_{json_backend}"
+
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        rubric.save_to_json(dest_dir=shared_tmp, filename=filename)
+
+    assert not (shared_tmp / f"{filename}.json").exists()
+
+
+def test_criterion_save_to_json(shared_tmp: Path):
     """Test saving a Criterion object to a JSON file and verify content."""
     # 1. Setup
     criterion = Criterion(
@@ -251,24 +286,27 @@ def test_criterion_save_to_json(tmp_path: Path):
     )
 
     filename = "test_criterion_save"
-    filepath = tmp_path / f"{filename}.json"
+    filepath = shared_tmp / f"{filename}.json"
 
     # 2. Action: Save the criterion
-    criterion.save_to_json(dest_dir=tmp_path, filename=filename)
+    criterion.save_to_json(dest_dir=shared_tmp, filename=filename)
 
     # 3. Assertion: Verify the file exists
     assert filepath.is_file()
 
     # 4. Assertion: Verify the content
-    with open(filepath, "r") as f:
-        data = json.load(f)
-
-    assert data["id"] == "focus"
-    assert data["weight"] == 0.75
-    assert data["scale"] == "percentage"
+    data = json.loads(filepath.read_text())
+
+    assert data == {
+        "id": "focus",
+        "name": "Focus on Task",
+        "description": "The extent to which the submission addresses the prompt.",
+        "weight": 0.75,
+        "scale": "percentage",
+    }
 
 
-def test_criterion_load_from_json(tmp_path: Path):
+def test_criterion_load_from_json(shared_tmp: Path):
     """Test loading a Criterion object from a valid JSON file."""
     # 1. Setup: Create a file to load
     data_to_save = {
@@ -280,13 +318,14 @@ def test_criterion_load_from_json(tmp_path: Path):
     }
 
     filename = "test_criterion_load"
-    filepath = tmp_path / f"{filename}.json"
+    filepath = shared_tmp / f"{filename}.json"
 
-    with open(filepath, "w") as f:
-        json.dump(data_to_save, f)
+    filepath.write_text(json.dumps(data_to_save, separators=(",", ":")))
 
     # 2. Action: Load the criterion
-    loaded_criterion = Criterion.load_from_json(source_dir=tmp_path, filename=filename)
+    loaded_criterion = Criterion.load_from_json(
+        source_dir=shared_tmp, filename=filename
+    )
 
     # 3. Assertion: Verify the loaded object's attributes
     assert isinstance(loaded_criterion, Criterion)
@@ -296,7 +335,8 @@ def test_criterion_load_from_json(tmp_path: Path):
     assert loaded_criterion.scale == "0-1"
 
 
-def test_criterion_post_init_rejects_invalid_scale():
+@pytest.mark.parametrize("invalid_scale", ["0-100", "1-5", "", "percent", "0_1"])
+def test_criterion_post_init_rejects_invalid_scale(invalid_scale: str):
     """Criterion should raise ValueError if the scale is not a valid ScoreScale literal."""
     with pytest.raises(ValueError) as excinfo:
         Criterion(
@@ -304,12 +344,10 @@ def test_criterion_post_init_rejects_invalid_scale():
             name="Test Name",
             description="Test Desc",
             weight=1.0,
-            # Invalid scale
-            scale="0-100",  # type: ignore[arg-type]
+            scale=invalid_scale,  # type: ignore[arg-type]
         )
-    msg = str(excinfo.value)
-    assert "Invalid scale: 0-100" in msg
-    assert "Must be one of" in msg
+    excinfo.match(re.escape(f"Invalid scale: {invalid_scale}."))
+    excinfo.match(r"Must be one of")
 
 
 @pytest.mark.parametrize("invalid_weight", [0.0, -0.1, -5.0])
@@ -323,6 +361,46 @@ def test_criterion_post_init_rejects_non_positive_weight(invalid_weight: float):
             weight=invalid_weight,  # Non-positive weight
             scale="0-10",
         )
-    msg = str(excinfo.value)
-    assert f"Invalid weight: {invalid_weight}" in msg
-    assert "Must be positive" in msg
+    excinfo.match(re.escape(f"Invalid weight: {invalid_weight}"))
+    excinfo.match(r"Must be positive")
+
+
+def test_criterion_and_rubric_are_immutable(sample_criterion, rubric_factory):
+    """Criterion and Rubric instances should be frozen after validation."""
+    rubric = rubric_factory()
+
+    with pytest.raises(FrozenInstanceError):
+        sample_criterion.weight = 2.0  # type: ignore[misc]
+
+    with pytest.raises(FrozenInstanceError):
+        rubric.min_passing_score = 0  # type: ignore[misc]
+
+
+def test_rubric_criteria_are_copied_into_a_tuple(sample_criterion, rubric_factory):
+    """Mutating the list passed in must not affect the rubric or its caches."""
+    criteria = [sample_criterion]
+    rubric = rubric_factory(criteria=criteria)
+    assert rubric.total_weight == sample_criterion.weight
+
+    criteria.append(sample_criterion)
+
+    assert rubric.criteria == (sample_criterion,)
+    assert rubric.total_weight == sample_criterion.weight
+
+
+def test_rubric_criteria_index_is_case_folded_and_cached(rubric_factory):
+    """criteria_index maps case-folded ids to criteria and is built only once."""
+    criterion = Criterion(
+        id="Clarity",
+        name="Clarity",
+        description="How clear the submission is.",
+        weight=0.5,
+        scale="0-10",
+    )
+    rubric = rubric_factory(criteria=[criterion])
+
+    assert rubric.criteria_index == {"clarity": criterion}
+    assert rubric.criteria_index is rubric.criteria_index
+
+    # The cached index is not part of the serialized rubric
+    assert "criteria_index" not in asdict(rubric)